@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Compare a frozen_switch keyword table against the plain approaches.
+
+Builds a few thousand string keywords, then reports the memory footprint and
+the per-lookup dispatch time of:
+
+* ``frozen_switch`` called with each value - built once, dispatched many times
+* ``frozen_switch.get`` - the same table through its bound ``dict.get`` fast path
+* a raw ``dict`` of key -> action, the hand-rolled alternative
+* a ``switch`` block, rebuilt for every lookup as it is normally written
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from switchlang import frozen_switch, switch  # noqa: E402
+
+KEYWORD_COUNT = 3_000
+ACTION_COUNT = 16
+LOOKUPS = 10_000
+
+
+def main() -> None:
+    rng = random.Random(42)
+    actions = [lambda i=i: i for i in range(ACTION_COUNT)]
+    keywords = [f'kw_{i:05d}' for i in range(KEYWORD_COUNT)]
+    cases = {kw: actions[i % ACTION_COUNT] for i, kw in enumerate(keywords)}
+
+    # Build the probes from fresh string objects, as a tokenizer would.
+    probes = [''.join(rng.choice(keywords)) for _ in range(LOOKUPS)]
+    probes += [f'name_{i}' for i in range(LOOKUPS // 10)]
+
+    default = lambda: None  # noqa: E731
+    frozen = frozen_switch(cases, default=default)
+    table = dict(cases)
+
+    def run_frozen() -> None:
+        for p in probes:
+            frozen(p)
+
+    def run_frozen_get() -> None:
+        get = frozen.get
+        for p in probes:
+            get(p, default)()
+
+    def run_dict() -> None:
+        get = table.get
+        for p in probes:
+            get(p, default)()
+
+    def run_switch() -> None:
+        for p in probes[:100]:
+            with switch(p) as s:
+                for kw, action in cases.items():
+                    s.case(kw, action)
+                s.default(default)
+
+    dict_bytes = sys.getsizeof(table) + sum(sys.getsizeof(k) for k in table)
+    print(f'{KEYWORD_COUNT:,} keywords, {ACTION_COUNT} actions, {len(probes):,} lookups\n')
+    print(f'{"":<16}{"memory":>12}{"ns/lookup":>12}')
+    for name, size, func, count in (
+        ('frozen_switch', sys.getsizeof(frozen), run_frozen, len(probes)),
+        ('frozen.get', sys.getsizeof(frozen), run_frozen_get, len(probes)),
+        ('dict', dict_bytes, run_dict, len(probes)),
+        ('switch', None, run_switch, 100),
+    ):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        memory = f'{size:,} B' if size is not None else 'per block'
+        print(f'{name:<16}{memory:>12}{best / count * 1e9:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
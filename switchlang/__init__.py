@@ -13,6 +13,6 @@ try:
 except PackageNotFoundError:  # pragma: no cover
     __version__ = '0.0.0'
 __author__ = 'Michael Kennedy <michael@talkpython.fm>'
-__all__ = ['switch', 'closed_range']
+__all__ = ['switch', 'frozen_switch', 'closed_range']
 
-from .__switchlang_impl import closed_range, switch  # noqa: E402
+from .__switchlang_impl import closed_range, frozen_switch, switch  # noqa: E402
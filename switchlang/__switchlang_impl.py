@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import sys
 import uuid
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from types import TracebackType
 from typing import Any
 
@@ -29,10 +30,13 @@ class switch:
         """
         self.value = value
         self.cases: set[Any] = set()
-        self._found = False
         self.__result = switch.__no_result
-        self._falling_through = False
-        self._func_stack: list[Callable[[], Any]] = []
+        # The function and fall-through flag of each registered case, in registration
+        # order, plus the indexes of the matching case and the default case, if any.
+        self._funcs: list[Callable[[], Any]] = []
+        self._fallthrough: list[bool] = []
+        self._matched: int | None = None
+        self._default: int | None = None
 
     def default(self, func: Callable[[], Any]) -> None:
         """
@@ -53,12 +57,13 @@ class switch:
         :return: None
         """
         self.case(switch.__default, func)
+        self._default = len(self._funcs) - 1
 
     def case(
         self,
         key: Any,
         func: Callable[[], Any],
-        fallthrough: bool | None = False,
+        fallthrough: bool = False,
     ) -> bool:
         """
         Register a case for the switch block:
@@ -73,45 +78,41 @@ class switch:
         :param key: Key for the case test. If this is a list or range, each item is added as a case for `func`.
         :param func: Any callable taking no parameters, executed if this case matches.
         :param fallthrough: Optionally fall through to the subsequent case (defaults to False).
-                            `None` is reserved for internal use and leaves the fall-through state unchanged.
-        :return: True if this case (or any item of a list or range key) matched the switch value, otherwise False.
+        :return: True if this is the case that will run: the first one registered whose key (or any item of a
+                 list or range key) equals the switch value. Otherwise False, even for a later case whose key
+                 also equals the value.
         :raises ValueError: If the key is a duplicate, the key is an empty collection, or func is not callable.
         """
-        if fallthrough is not None:
-            if self._falling_through:
-                self._func_stack.append(func)
-                if not fallthrough:
-                    self._falling_through = False
+        if func is None:
+            raise ValueError('Action for case cannot be None.')
+        if not callable(func):
+            raise ValueError('Func must be callable.')
 
         if isinstance(key, range):
             key = list(key)
 
+        cases = self.cases
         if isinstance(key, list):
             if not key:
                 raise ValueError('You cannot pass an empty collection as the case. It will never match.')
 
-            found = False
-            for i in key:
-                if self.case(i, func, fallthrough=None):
-                    found = True
-                    if fallthrough is not None:
-                        self._falling_through = fallthrough
-
-            return found
-
-        if key in self.cases:
-            raise ValueError(f'Duplicate case: {key}')
-        if func is None:
-            raise ValueError('Action for case cannot be None.')
-        if not callable(func):
-            raise ValueError('Func must be callable.')
-
-        self.cases.add(key)
-        if key == self.value or not self._found and key == self.__default:
-            self._func_stack.append(func)
-            self._found = True
-            if fallthrough is not None:
-                self._falling_through = fallthrough
+            # Check every key before registering any, so a rejected list leaves no partial case behind.
+            for k in key:
+                if k in cases:
+                    raise ValueError(f'Duplicate case: {k}')
+            cases.update(key)
+            # Only the first matching case runs, so once one has matched no later key is compared.
+            found = self._matched is None and any(k == self.value for k in key)
+        else:
+            if key in cases:
+                raise ValueError(f'Duplicate case: {key}')
+            cases.add(key)
+            found = self._matched is None and key == self.value
+
+        self._funcs.append(func)
+        self._fallthrough.append(fallthrough)
+        if found:
+            self._matched = len(self._funcs) - 1
             return True
 
         return False
@@ -140,12 +141,34 @@ class switch:
         if exc_val is not None:
             raise exc_val
 
-        if not self._func_stack:
+        matched = self._matched
+        default = self._default
+
+        # A default registered before the matching case runs as well (see `default()`).
+        if default is not None and (matched is None or default < matched):
+            self._run_from(default)
+            if matched is not None:
+                self._run_from(matched)
+        elif matched is not None:
+            self._run_from(matched)
+        else:
             raise Exception(f'Value does not match any case and there is no default case: value {self.value}')
 
-        for func in self._func_stack:
+    def _run_from(self, start: int) -> None:
+        """
+        Run the case at `start`, then every case it falls through to.
+
+        :param start: The index of the first case to run.
+        """
+        funcs = self._funcs
+        fallthrough = self._fallthrough
+        for index in range(start, len(funcs)):
             # noinspection PyCallingNonCallable
-            self.__result = func()
+            result = funcs[index]()
+            if not fallthrough[index]:
+                break
+
+        self.__result = result
 
     @property
     def result(self) -> Any:
@@ -175,6 +198,113 @@ class switch:
         return self.__result
 
 
+class frozen_switch:
+    """
+    A switch over a fixed set of string keys, built once and dispatched many times.
+
+    Use it for large keyword tables known up front (tokenizers, command names):
+    each key maps straight to its action in a single dictionary.
+
+    ```
+        keywords = frozen_switch(
+            {
+                'if': handle_if,
+                ('for', 'while'): handle_loop,
+            },
+            default=handle_name,
+        )
+
+        res = keywords(token)
+    ```
+
+    Calling the switch costs a Python-level call on top of the lookup. In a hot
+    loop, use `get` instead: it is the lookup table's own `dict.get`, so
+    `keywords.get(token, keywords.default)()` dispatches as fast as a raw dict.
+    """
+
+    __slots__ = ('_table', 'default', 'get')
+
+    def __init__(
+        self,
+        cases: Mapping[str | tuple[str, ...], Callable[[], Any]],
+        default: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        Build a frozen switch from its complete set of cases.
+
+        :param cases: Maps each key to its action. A tuple of keys registers every key for the same action.
+        :param default: Optional callable taking no parameters, executed if no key matches.
+        :raises ValueError: If a key is not a string or is a duplicate, a tuple key is empty, or an action
+                            is not callable.
+        """
+        table: dict[str, Callable[[], Any]] = {}
+        for key, func in cases.items():
+            keys = key if isinstance(key, tuple) else (key,)
+            if not keys:
+                raise ValueError('You cannot pass an empty collection as the case. It will never match.')
+            if func is None:
+                raise ValueError('Action for case cannot be None.')
+            if not callable(func):
+                raise ValueError('Func must be callable.')
+
+            for k in keys:
+                if type(k) is not str:
+                    raise ValueError(f'Frozen switch keys must be strings: {k!r}')
+                if k in table:
+                    raise ValueError(f'Duplicate case: {k}')
+                table[k] = func
+
+        if default is not None and not callable(default):
+            raise ValueError('Func must be callable.')
+
+        self._table = table
+        self.default = default
+        self.get: Callable[..., Callable[[], Any] | None] = table.get
+
+    def __call__(self, value: Any) -> Any:
+        """
+        Run the action for `value` and return its result.
+
+        :param value: The value to dispatch on.
+        :return: The value returned by the matched case's function (or the default's).
+        :raises Exception: If no case matched the value and no default case was given.
+        """
+        try:
+            func = self._table.get(value, self.default)
+        except TypeError:
+            # Unhashable values cannot be keys, so they never match.
+            func = self.default
+        if func is None:
+            raise Exception(f'Value does not match any case and there is no default case: value {value}')
+
+        return func()
+
+    def __contains__(self, value: Any) -> bool:
+        """
+        Test whether `value` is one of the keys (the default does not count).
+        """
+        try:
+            return value in self._table
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        """
+        The number of keys in the switch.
+        """
+        return len(self._table)
+
+    def __sizeof__(self) -> int:
+        """
+        The memory footprint of the switch in bytes, as reported by `sys.getsizeof()`.
+
+        Counts the instance, the lookup table and its keys, but not the action
+        functions, which are shared with the caller.
+        """
+        keys = sum(sys.getsizeof(k) for k in self._table)
+        return object.__sizeof__(self) + sys.getsizeof(self._table) + keys
+
+
 def closed_range(start: int, stop: int, step: int = 1) -> range:
     """
     Create a closed range for a case: both `start` and `stop` are included.
@@ -1,6 +1,7 @@
+import sys
 import unittest
 
-from switchlang import closed_range, switch
+from switchlang import closed_range, frozen_switch, switch
 
 
 # here is a custom type we can use as a key for our tests
@@ -334,6 +335,92 @@ class CoreTests(unittest.TestCase):
         self.assertEqual(s.result, 'default')
         self.assertEqual(visited, ['default'])
 
+    def test_fallthrough_chain_ends_at_last_case(self):
+        visited = []
+        with switch(3) as s:
+            s.case(1, lambda: visited.append(1) or 1)
+            s.case(3, lambda: visited.append(3) or 3, fallthrough=True)
+            s.case(4, lambda: visited.append(4) or 4, fallthrough=True)
+
+        self.assertEqual(s.result, 4)
+        self.assertEqual(visited, [3, 4])
+
+    def test_unhashable_value_matches_by_equality(self):
+        class Loose:
+            __hash__ = None
+
+            def __eq__(self, other):
+                return other == 'x'
+
+        with switch(Loose()) as s:
+            s.case('a', lambda: 'a')
+            s.case('x', lambda: 'x')
+            s.default(lambda: 'default')
+
+        self.assertEqual(s.result, 'x')
+
+    def test_value_equal_to_key_with_different_hash(self):
+        # matching is by equality alone, as case() reports it
+        class Loose:
+            def __eq__(self, other):
+                return other == 'x'
+
+            def __hash__(self):
+                return 0
+
+        with switch(Loose()) as s:
+            matched = s.case('x', lambda: 'x')
+            s.default(lambda: 'default')
+
+        self.assertTrue(matched)
+        self.assertEqual(s.result, 'x')
+
+    def test_nan_value_matches_neither_scalar_nor_list_key(self):
+        # nan != nan: list keys must use == like scalar keys, not identity-first `in`
+        nan = float('nan')
+        with switch(nan) as s:
+            scalar = s.case(nan, lambda: 'scalar')
+            s.default(lambda: 'default')
+
+        self.assertFalse(scalar)
+        self.assertEqual(s.result, 'default')
+
+        with switch(nan) as s:
+            listed = s.case([nan], lambda: 'list')
+            s.default(lambda: 'default')
+
+        self.assertFalse(listed)
+        self.assertEqual(s.result, 'default')
+
+    def test_only_first_equal_case_runs(self):
+        class AorB:
+            def __eq__(self, other):
+                return other in ('a', 'b')
+
+            __hash__ = object.__hash__
+
+        visited = []
+        with switch(AorB()) as s:
+            first = s.case('a', lambda: visited.append('a') or 'a')
+            second = s.case('b', lambda: visited.append('b') or 'b')
+            s.default(lambda: 'default')
+
+        self.assertTrue(first)
+        self.assertFalse(second)
+        self.assertEqual(s.result, 'a')
+        self.assertEqual(visited, ['a'])
+
+    def test_rejected_list_case_leaves_nothing_registered(self):
+        with switch('z') as s:
+            s.case('a', lambda: 'a')
+            with self.assertRaises(ValueError):
+                s.case(['z', 'a'], lambda: 'z')
+            s.case('q', lambda: 'q')
+            s.default(lambda: 'default')
+
+        self.assertEqual(s.result, 'default')
+        self.assertNotIn('z', s.cases)
+
     def test_empty_collection_clause_is_error(self):
         with self.assertRaises(ValueError):
             with switch('val') as s:
@@ -341,5 +428,78 @@ class CoreTests(unittest.TestCase):
                 s.default(lambda: 'default')
 
 
+class FrozenSwitchTests(unittest.TestCase):
+    def test_matched_case(self):
+        keywords = frozen_switch({'if': lambda: 'if', 'else': lambda: 'else'}, default=lambda: 'name')
+
+        self.assertEqual(keywords('else'), 'else')
+        self.assertEqual(keywords('elif'), 'name')
+
+    def test_tuple_key_registers_every_key(self):
+        keywords = frozen_switch({('for', 'while'): lambda: 'loop', 'if': lambda: 'if'})
+
+        self.assertEqual(keywords('for'), 'loop')
+        self.assertEqual(keywords('while'), 'loop')
+        self.assertEqual(len(keywords), 3)
+
+    def test_get_fast_path(self):
+        keywords = frozen_switch({'if': lambda: 'if'}, default=lambda: 'name')
+
+        self.assertEqual(keywords.get('if', keywords.default)(), 'if')
+        self.assertEqual(keywords.get('x', keywords.default)(), 'name')
+        self.assertIsNone(keywords.get('x'))
+
+    def test_unhashable_value_runs_default(self):
+        keywords = frozen_switch({'a': lambda: 'a'}, default=lambda: 'default')
+
+        self.assertNotIn(['a'], keywords)
+        self.assertEqual(keywords(['a']), 'default')
+
+    def test_keys_match_equal_strings(self):
+        # lookups come from fresh string objects (e.g. sliced from source text)
+        keywords = frozen_switch({'return': lambda: 'return'})
+        token = ''.join(['ret', 'urn'])
+
+        self.assertIn(token, keywords)
+        self.assertEqual(keywords(token), 'return')
+
+    def test_error_no_match_no_default(self):
+        keywords = frozen_switch({'if': lambda: 'if'})
+
+        self.assertNotIn('else', keywords)
+        with self.assertRaises(Exception):
+            keywords('else')
+
+    def test_error_invalid_cases(self):
+        with self.assertRaises(ValueError):
+            frozen_switch({1: lambda: None})
+
+        with self.assertRaises(ValueError):
+            frozen_switch({('a', 'b'): lambda: None, 'b': lambda: None})
+
+        with self.assertRaises(ValueError):
+            frozen_switch({(): lambda: None})
+
+        with self.assertRaises(ValueError):
+            frozen_switch({'a': 'not callable'})
+
+        with self.assertRaises(ValueError):
+            frozen_switch({'a': lambda: None}, default='not callable')
+
+    def test_sizeof_counts_table_and_keys(self):
+        def footprint(cases):
+            # an equal dict built key by key, as frozen_switch builds its table
+            table = {k: v for k, v in cases.items()}
+            return sys.getsizeof(table) + sum(sys.getsizeof(k) for k in table)
+
+        small = {'a': lambda: None}
+        large = {f'kw_{i}': lambda: None for i in range(1000)}
+
+        # the instance itself adds the same fixed, slotted overhead at any size
+        overhead = sys.getsizeof(frozen_switch(small)) - footprint(small)
+        self.assertEqual(sys.getsizeof(frozen_switch(large)) - footprint(large), overhead)
+        self.assertLess(overhead, 100)
+
+
 if __name__ == '__main__':
     unittest.main()